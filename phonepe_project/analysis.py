@@ -1,4 +1,9 @@
+import itertools
+
+import numpy as np
 import pandas as pd
+from sketches import HyperLogLog
+
 def filter_data(df, state, year, quarter):
     if state != "All":
         df = df[df['State'] == state]
@@ -57,4 +62,96 @@ def insurance_kpis(df):
     return total_amount, total_count, unique_types
 
 def insurance_by_type(df):
-    return df.groupby("Type")["Transaction_amount"].sum().reset_index()
\ No newline at end of file
+    return df.groupby("Type")["Transaction_amount"].sum().reset_index()
+
+# ========================================
+# BATCH SLICES (many State/Year/Quarter combinations from one grouped pass)
+# ========================================
+def transaction_cube(df):
+    # totals per (State, Year, Quarter, Transaction_type); every slice is a filter over this
+    keys = ['State', 'Year', 'Quarter', 'Transaction_type']
+    return df.groupby(keys, dropna=False, as_index=False)[['Transaction_amount', 'Transaction_count']].sum()
+
+def batch_slice_kpis(cube, slices):
+    results = []
+    for state, year, quarter in slices:
+        part = filter_data(cube, state, year, quarter)
+        results.append({
+            'slice': (state, year, quarter),
+            'kpis': get_kpis(part),
+            'by_type': transaction_by_type(part),
+        })
+    return results
+
+def slice_label(state, year, quarter):
+    place = "All India" if state == "All" else state.replace("-", " ").title()
+    if year == "All":
+        return f"{place} · All years" if quarter == "All" else f"{place} · Q{quarter} (all years)"
+    return f"{place} · {year}" if quarter == "All" else f"{place} · {year} Q{quarter}"
+
+def year_quarters(cube, year):
+    # quarters with data in a year; Pulse's latest year is usually partial
+    return sorted(cube.loc[cube['Year'] == year, 'Quarter'].dropna().unique().tolist())
+
+def comparison_slices(cube, mode, state, year, quarter):
+    # returns (current, baseline) slices, or None when the selected or the baseline period
+    # is not in the data
+    current = (state, year, quarter)
+    if mode == "State vs National":
+        return current, ("All", year, quarter)
+    if mode == "Year vs Previous Year":
+        years = sorted(cube['Year'].dropna().unique().tolist())
+        if year not in years or years.index(year) == 0:
+            return None
+        return (state, year, "All"), (state, years[years.index(year) - 1], "All")
+    periods = sorted(cube[['Year', 'Quarter']].dropna().drop_duplicates().itertuples(index=False, name=None))
+    if (year, quarter) not in periods or periods.index((year, quarter)) == 0:
+        return None
+    return current, (state, *periods[periods.index((year, quarter)) - 1])
+
+def comparison_frame(results):
+    # long format by-type amounts of every slice, for grouped bar charts
+    frames = [
+        r['by_type'].rename('Transaction_amount').reset_index().assign(Slice=slice_label(*r['slice']))
+        for r in results
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+# ========================================
+# APPROXIMATE MODE (sketches per State/Year/Quarter filter selection)
+# ========================================
+def build_slice_sketches(df, sum_cols=(), distinct_col=None, precision=12):
+    # one fixed-size summary (column sums + HyperLogLog registers) per (State, Year, Quarter) slice,
+    # rolled up ahead of time into every filter selection the sidebars can make ("All" or one value
+    # per key), so answering a selection is a dict lookup instead of a merge over slices
+    keys = ['State', 'Year', 'Quarter']
+    groups = df.groupby(keys)
+    slices = groups.size().index.to_frame(index=False)
+    sums = groups[list(sum_cols)].sum().reset_index(drop=True)
+    registers = None
+    if distinct_col:
+        registers = np.stack([HyperLogLog(precision).add(part[distinct_col]).registers for _, part in groups])
+
+    rollups = {}
+    for fixed in itertools.product([True, False], repeat=len(keys)):
+        by = [k for k, f in zip(keys, fixed) if f]
+        selections = slices.groupby(by).indices if by else {(): np.arange(len(slices))}
+        for values, idx in selections.items():
+            values = iter(values if isinstance(values, tuple) else (values,))
+            selection = tuple(next(values) if f else "All" for f in fixed)
+            rollups[selection] = {
+                # per column, so integer counts stay integers
+                'sums': {c: sums[c].iloc[idx].sum() for c in sums.columns},
+                'distinct': HyperLogLog.from_registers(registers[idx].max(axis=0)) if registers is not None else None,
+            }
+    return rollups
+
+def slice_rollup(sketches, state, year, quarter):
+    # the precomputed summary for a filter selection, None when no slice matches it
+    return sketches.get((state, year, quarter))
+
+def approx_kpis(rollup, amount='Transaction_amount', count='Transaction_count'):
+    if rollup is None:
+        return None
+    distinct = rollup['distinct']
+    return rollup['sums'][amount], rollup['sums'][count], round(distinct.estimate()), distinct.relative_error
@@ -0,0 +1,130 @@
+'''
+Benchmark filtered loads before and after the managed schema (schema.py).
+
+"Before" is the table as caseStudy.ipynb used to write it: the same rows
+written with DataFrame.to_sql(if_exists='replace'), i.e. an unindexed,
+unpartitioned heap with a TEXT Year (the notebook takes years from
+directory names), in the notebook's state -> year -> quarter load order.
+"After" is the managed table, partitioned by Year and indexed on (State,
+Year, Quarter). Both are read through db_connect.load_table with the same
+filters.
+
+    python bench_schema.py                         # data already in PHONEPE_DB_URL
+    python bench_schema.py --synthetic --pincodes 50
+
+--synthetic migrates PHONEPE_DB_URL and REPLACES its tables with synthetic
+data, so only point it at a scratch database.
+'''
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+
+import synthetic_data
+from db_connect import engine, filter_clause, load_table
+from schema import PARTITIONED_TABLES, applied_migrations, migrate, reload_table, MIGRATIONS
+
+BENCH_TABLES = ["top_transaction_pincode", "top_insurance_pincode", "map_insurance_country", "top_transaction_district"]
+
+
+def scanned_relations(plan):
+    names = [plan["Relation Name"]] if "Relation Name" in plan else []
+    for child in plan.get("Plans", []):
+        names += scanned_relations(child)
+    return names
+
+
+def explain(table, filters):
+    where, params = filter_clause(*filters)
+    with engine.connect() as conn:
+        result = conn.execute(text(f'EXPLAIN (ANALYZE, FORMAT JSON) SELECT * FROM "{table}"{where}'), params).scalar()
+    return result[0]
+
+
+def time_filters(table, filters, repeat):
+    server, loader = [], []
+    for _ in range(repeat):
+        server.append(explain(table, filters)["Execution Time"])
+        start = time.perf_counter()
+        rows = len(load_table(table, *filters))
+        loader.append((time.perf_counter() - start) * 1000)
+    plan = explain(table, filters)["Plan"]
+    return {
+        "rows": rows,
+        "scans": len(set(scanned_relations(plan))),
+        "server_ms": statistics.median(server),
+        "loader_ms": statistics.median(loader),
+    }
+
+
+def write_heap(df, heap):
+    # the layout to_sql gave the notebook's DataFrames: Year as str, rows in load order
+    df = df.astype({"Year": str}).sort_values(["State", "Year", "Quarter"], kind="stable")
+    df.to_sql(heap, engine, if_exists="replace", index=False, chunksize=10000)
+    with engine.begin() as conn:
+        conn.execute(text(f'ANALYZE "{heap}"'))
+
+
+def sample_filters(table):
+    # a real state and the latest year present in the table
+    with engine.connect() as conn:
+        state, year = conn.execute(text(f'SELECT "State", "Year" FROM "{table}" ORDER BY "Year" DESC, "State" LIMIT 1')).one()
+    return [
+        ("state", (state, "All", "All")),
+        ("year", ("All", year, "All")),
+        ("year+quarter", ("All", year, 1)),
+        ("state+year+quarter", (state, year, 1)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark filtered loads on heap vs managed tables")
+    parser.add_argument("--synthetic", action="store_true", help="load synthetic data first (scratch databases only)")
+    parser.add_argument("--districts", type=int, default=20, help="synthetic districts per state")
+    parser.add_argument("--pincodes", type=int, default=50, help="synthetic pincodes per district")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per query; the median is reported")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        migrate(engine)
+        print(f"Loading synthetic data ({args.districts} districts/state, {args.pincodes} pincodes/district)...")
+        frames = synthetic_data.build_tables(args.districts, args.pincodes)
+        for name, df in frames.items():
+            reload_table(df, name, engine)
+    else:
+        with engine.begin() as conn:
+            pending = [v for v, _, _ in MIGRATIONS if v not in applied_migrations(conn)]
+        if pending:
+            raise SystemExit(f"Migrations {pending} are not applied; run `python schema.py` first.")
+        frames = {table: load_table(table) for table in BENCH_TABLES}
+
+    rows = []
+    for table in BENCH_TABLES:
+        heap = f"{table}_heap"
+        write_heap(frames[table], heap)
+        try:
+            for label, filters in sample_filters(table):
+                before = time_filters(heap, filters, args.repeat)
+                after = time_filters(table, filters, args.repeat)
+                rows.append([
+                    table, label, f"{after['rows']:,}",
+                    f"{before['server_ms']:,.2f}", f"{after['server_ms']:,.2f}",
+                    f"{before['loader_ms']:,.1f}", f"{after['loader_ms']:,.1f}",
+                    f"{before['server_ms'] / max(after['server_ms'], 1e-3):,.1f}x",
+                    str(after["scans"]) if table in PARTITIONED_TABLES else "-",
+                ])
+        finally:
+            with engine.begin() as conn:
+                conn.execute(text(f'DROP TABLE "{heap}"'))
+
+    header = ["table", "filter", "rows", "heap_sql_ms", "managed_sql_ms", "heap_load_ms",
+              "managed_load_ms", "sql_speedup", "partitions_scanned"]
+    widths = [max(len(h), *(len(r[i]) for r in rows)) for i, h in enumerate(header)]
+    print("  ".join(h.rjust(w) for h, w in zip(header, widths)))
+    for r in rows:
+        print("  ".join(v.rjust(w) for v, w in zip(r, widths)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+'''
+Cached data shared by the dashboard views.
+
+Each table, or State/Year/Quarter slice of it, is loaded on first use and
+cached per process, so a view only pays for the rows it reads (the Overview
+no longer waits for the insurance and pincode tables).
+'''
+import streamlit as st
+
+from db_connect import load_table
+from analysis import build_slice_sketches, top_kpi_by_location, transaction_cube as build_transaction_cube
+
+# Sketches per filter selection for approximate mode: name -> (table, build options)
+SKETCH_SPECS = {
+    "transaction": ("agg_transaction", dict(sum_cols=["Transaction_amount", "Transaction_count"], distinct_col="Transaction_type")),
+    "insurance": ("agg_insurance", dict(sum_cols=["Transaction_amount", "Transaction_count"], distinct_col="Type")),
+}
+
+# Per-process cache bounds. Both caches are LRU, so whole tables (read on every rerun for the
+# filter options, sketches and cube) stay, while slices nobody revisits are evicted. A year slice
+# of a pincode table is the largest slice, at about 1/8 of the table.
+LOAD_MAX_ENTRIES = 64
+TOP_K_MAX_ENTRIES = 256
+
+# filters run in SQL (Year partition pruning and the (State, Year, Quarter) indexes, see schema.py),
+# and every slice a view asks for is cached on its own, up to LOAD_MAX_ENTRIES slices per process
+@st.cache_data(max_entries=LOAD_MAX_ENTRIES)
+def load(table, state="All", year="All", quarter="All"):
+    return load_table(table, state, year, quarter)
+
+# cache_resource shares the sketches read-only instead of unpickling a copy on every rerun
+@st.cache_resource
+def sketches(name):
+    table, options = SKETCH_SPECS[name]
+    return build_slice_sketches(load(table), **options)
+
+# exact top-k per filter selection, in both modes: a heavy-hitter summary small enough to be
+# cheaper than this left bounds too wide to rank pincodes by
+@st.cache_data(max_entries=TOP_K_MAX_ENTRIES)
+def top_k(table, col, value, state="All", year="All", quarter="All", top_n=10):
+    return top_kpi_by_location(load(table, state, year, quarter), col=col, value=value, top_n=top_n)
+
+# Transaction totals per (State, Year, Quarter, Transaction_type) from one grouped pass;
+# the Compare view reads all of its slices from this instead of re-filtering the raw data
+@st.cache_data
+def transaction_cube():
+    return build_transaction_cube(load("agg_transaction"))
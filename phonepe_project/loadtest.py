@@ -0,0 +1,270 @@
+'''
+Concurrent-session load test for the dashboard.
+
+Runs app.py headlessly with Streamlit's AppTest against a synthetic SQLite
+stand-in for the PostgreSQL database (see synthetic_data.py), so it needs no
+network and no database server. Every scenario runs in a fresh process so
+cache warm-up and peak memory are measured per scenario.
+
+    python loadtest.py --sessions 8 --steps 25
+    python loadtest.py --scenario overview_filters --sessions 32 --pincodes 50
+    python loadtest.py --approx --scenario insurance_filters
+
+Switching st.tabs is client side only (every tab body runs on each rerun), so
+"flipping tabs" is simulated by driving the widgets that live inside tabs.
+'''
+import argparse
+import json
+import multiprocessing as mp
+import os
+import random
+import resource
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
+
+import numpy as np
+
+import synthetic_data
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+# the release share_replica_state was written against (requirements.txt floors it)
+TESTED_STREAMLIT = "1.66"
+VIEWS = ["Overview", "Top Districts", "Top Pincodes", "Top Users", "Transaction Map", "Insurance Insights", "Compare"]
+
+
+def pick(widget, rng):
+    widget.select_index(rng.randrange(len(widget.options)))
+
+
+def sidebar_selectbox(at, label):
+    return next(sb for sb in at.sidebar.selectbox if sb.label == label)
+
+
+def go_to(at, view, rerun):
+    # only switch (and rerun) when the session is on another view; that rerun is a
+    # latency sample like any other
+    radio = at.sidebar.radio[0]
+    if radio.value != view:
+        radio.set_value(view)
+        rerun()
+
+
+# ========================================
+# SCENARIOS
+# each step mutates widgets of one session; the caller times the rerun.
+# rerun() is the caller's timed at.run(), for steps that need the widgets of another view first
+# ========================================
+def step_views(at, rng, rerun):
+    at.sidebar.radio[0].set_value(rng.choice(VIEWS))
+
+
+def step_overview_filters(at, rng, rerun):
+    go_to(at, "Overview", rerun)
+    choice = rng.choice(["Select State", "Select Year", "Select Quarter", "trend_type"])
+    if choice == "trend_type":
+        pick(at.selectbox(key="trend_type"), rng)
+    else:
+        pick(sidebar_selectbox(at, choice), rng)
+
+
+def step_map_filters(at, rng, rerun):
+    go_to(at, "Transaction Map", rerun)
+    pick(at.selectbox(key=rng.choice(["map_state", "map_year", "map_quarter"])), rng)
+
+
+def step_insurance_filters(at, rng, rerun):
+    go_to(at, "Insurance Insights", rerun)
+    pick(at.selectbox(key=rng.choice(["ins_state", "ins_year", "ins_qtr"])), rng)
+
+
+def step_compare(at, rng, rerun):
+    go_to(at, "Compare", rerun)
+    choice = rng.choice(["cmp_mode", "cmp_state", "cmp_year", "cmp_quarter"])
+    if choice == "cmp_mode":
+        mode = at.radio(key="cmp_mode")
+        mode.set_value(rng.choice(mode.options))
+    elif choice == "cmp_quarter":
+        # the quarter selectbox depends on the mode (and is absent for year comparisons)
+        boxes = [sb for sb in at.sidebar.selectbox if sb.key in ("cmp_qtr", "cmp_qtr_all")]
+        pick(boxes[0] if boxes else at.selectbox(key="cmp_year"), rng)
+    else:
+        pick(at.selectbox(key=choice), rng)
+
+
+def step_mixed(at, rng, rerun):
+    rng.choice([step_views, step_overview_filters, step_map_filters, step_insurance_filters, step_compare])(at, rng, rerun)
+
+
+SCENARIOS = {
+    "views": step_views,
+    "overview_filters": step_overview_filters,
+    "map_filters": step_map_filters,
+    "insurance_filters": step_insurance_filters,
+    "compare": step_compare,
+    "mixed": step_mixed,
+}
+
+
+def share_replica_state():
+    # AppTest is built for one run at a time: every run creates its own ScriptCache,
+    # installs (then clears) a process-wide Runtime and patches (then restores) the
+    # global.appTest option. A real server process has one of each, shared by all
+    # sessions, so do the same here. This keeps script compilation out of the rerun
+    # numbers, avoids concurrent ast.parse calls (not thread-safe on 3.11) and stops one
+    # session's run from tearing down state another session's run is still using.
+    # All of these are Streamlit internals (see TESTED_STREAMLIT): stop if a release
+    # moves one, rather than measure sessions that silently stopped sharing state.
+    import streamlit
+    from streamlit import config
+    from streamlit.runtime.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    expected = [(Runtime, "_instance"), (Runtime, "instance"),
+                (app_test, "ScriptCache"), (local_script_runner, "ScriptCache")]
+    missing = [f"{owner.__name__}.{name}" for owner, name in expected if not hasattr(owner, name)]
+    if "global.appTest" not in config.get_config_options():
+        missing.append("config option global.appTest")
+    if missing:
+        raise RuntimeError(f"streamlit {streamlit.__version__} lacks {', '.join(missing)}; "
+                           f"loadtest.py shares replica state through these and was tested on {TESTED_STREAMLIT}")
+
+    shared = ScriptCache()
+    app_test.ScriptCache = lambda: shared
+    local_script_runner.ScriptCache = lambda: shared
+
+    last = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            last["runtime"] = cls._instance
+        return last["runtime"] if "runtime" in last else cls._instance
+
+    Runtime.instance = classmethod(instance)
+    config.set_option("global.appTest", True)
+
+
+def run_session(session_id, scenario, steps, seed, timeout, approx):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed * 1000 + session_id)
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.session_state["approx_mode"] = approx
+
+    start = time.perf_counter()
+    at.run()
+    first_run = time.perf_counter() - start
+
+    latencies, errors = [], [len(at.exception)]
+
+    def rerun():
+        start = time.perf_counter()
+        at.run()
+        latencies.append(time.perf_counter() - start)
+        errors[0] += len(at.exception)
+
+    # a step may rerun once more to switch views, so a session makes steps..2*steps reruns
+    for _ in range(steps):
+        SCENARIOS[scenario](at, rng, rerun)
+        rerun()
+    return first_run, latencies, errors[0]
+
+
+def run_scenario(scenario, sessions, steps, seed, timeout, approx, queue):
+    from streamlit.testing.v1 import AppTest
+
+    share_replica_state()
+
+    # one warm-up session fills st.cache_data, like the first visitor of a new replica
+    start = time.perf_counter()
+    warm_up = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    warm_up.session_state["approx_mode"] = approx
+    warm_up.run()
+    cold_start = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda i: run_session(i, scenario, steps, seed, timeout, approx), range(sessions)))
+    wall = time.perf_counter() - start
+
+    first_runs = [r[0] for r in results]
+    latencies = np.array([lat for r in results for lat in r[1]])
+    reruns = len(first_runs) + len(latencies)
+    queue.put({
+        "scenario": scenario + (" (approx)" if approx else ""),
+        "sessions": sessions,
+        "reruns": reruns,
+        "errors": sum(r[2] for r in results),
+        "cold_start_ms": cold_start * 1000,
+        "first_run_p50_ms": float(np.percentile(first_runs, 50)) * 1000,
+        "p50_ms": float(np.percentile(latencies, 50)) * 1000 if len(latencies) else 0.0,
+        "p95_ms": float(np.percentile(latencies, 95)) * 1000 if len(latencies) else 0.0,
+        "p99_ms": float(np.percentile(latencies, 99)) * 1000 if len(latencies) else 0.0,
+        "throughput_rps": reruns / wall,
+        # ru_maxrss is reported in KiB on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    })
+
+
+def print_report(results):
+    columns = ["scenario", "sessions", "reruns", "errors", "cold_start_ms", "first_run_p50_ms",
+               "p50_ms", "p95_ms", "p99_ms", "throughput_rps", "peak_rss_mb"]
+    rows = [[f"{r[c]:,.1f}" if isinstance(r[c], float) else str(r[c]) for c in columns] for r in results]
+    widths = [max(len(c), *(len(row[i]) for row in rows)) for i, c in enumerate(columns)]
+    print("  ".join(c.rjust(w) for c, w in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(v.rjust(w) for v, w in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the PhonePe dashboard")
+    parser.add_argument("--scenario", choices=["all"] + list(SCENARIOS), default="all")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 8],
+                        help="concurrent sessions; several values run the scenario once per value")
+    parser.add_argument("--steps", type=int, default=20, help="reruns per session after its first run")
+    parser.add_argument("--districts", type=int, default=10, help="synthetic districts per state")
+    parser.add_argument("--pincodes", type=int, default=10, help="synthetic pincodes per district")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds allowed per rerun")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--approx", action="store_true", help="run the sessions with approximate mode on")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    scenarios = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{os.path.join(tmp, 'phonepe_loadtest.db')}"
+        print(f"Building synthetic database ({args.districts} districts/state, {args.pincodes} pincodes/district)...")
+        synthetic_data.write_tables(db_url, synthetic_data.build_tables(args.districts, args.pincodes, args.seed))
+        os.environ["PHONEPE_DB_URL"] = db_url
+        os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+        ctx = mp.get_context("spawn")
+        results = []
+        for scenario in scenarios:
+            for sessions in args.sessions:
+                print(f"Running {scenario} with {sessions} session(s)...")
+                queue = ctx.Queue()
+                proc = ctx.Process(target=run_scenario,
+                                   args=(scenario, sessions, args.steps, args.seed, args.timeout, args.approx, queue))
+                proc.start()
+                while True:
+                    try:
+                        results.append(queue.get(timeout=1))
+                        break
+                    except Empty:
+                        if not proc.is_alive():
+                            raise SystemExit(f"{scenario} run crashed (exit code {proc.exitcode})")
+                proc.join()
+
+    print()
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
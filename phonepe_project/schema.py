@@ -0,0 +1,185 @@
+'''
+Managed PostgreSQL schema for the PhonePe Pulse tables.
+
+The map/top fact tables are LIST-partitioned by Year (one partition per year
+plus a DEFAULT one), so filtered loads only scan the matching year. Every
+table gets a composite (State, Year, Quarter) B-tree index, which serves all
+of the app's filters. reload_table writes rows in that order, so matching
+rows sit together on disk.
+
+Schema changes are ordered migrations recorded in schema_migrations:
+
+    python schema.py            # apply pending migrations to PHONEPE_DB_URL
+    python schema.py --status   # list applied migrations
+
+Run the migrations before loading data, then load with reload_table()
+instead of DataFrame.to_sql(if_exists='replace'), which would drop the
+managed table.
+'''
+import argparse
+
+import pandas as pd
+from sqlalchemy import inspect, text
+
+KEY_COLUMNS = {"State": "TEXT", "Year": "SMALLINT", "Quarter": "SMALLINT"}
+
+# table -> non-key columns; order matches the DataFrames built in caseStudy.ipynb
+TABLES = {
+    "agg_transaction": {"From": "BIGINT", "To": "BIGINT", "Transaction_type": "TEXT",
+                        "Transaction_count": "BIGINT", "Transaction_amount": "DOUBLE PRECISION"},
+    "agg_user": {"RegisteredUsers": "BIGINT", "AppOpens": "BIGINT"},
+    "agg_user_device": {"Brand": "TEXT", "Count": "BIGINT", "Percentage": "DOUBLE PRECISION"},
+    "agg_insurance": {"From": "BIGINT", "To": "BIGINT", "Type": "TEXT",
+                      "Transaction_count": "BIGINT", "Transaction_amount": "DOUBLE PRECISION"},
+    "map_insurance_country_meta": {"DataLevel": "TEXT", "GridLevel": "TEXT",
+                                   **{p: "DOUBLE PRECISION" for p in
+                                      ["P10", "P20", "P30", "P40", "P50", "P60", "P80", "P90", "P99_5"]}},
+    "map_transaction": {"District": "TEXT", "Transaction_count": "BIGINT", "Transaction_amount": "DOUBLE PRECISION"},
+    "map_user": {"District": "TEXT", "Registered_Users": "BIGINT", "App_Opens": "BIGINT"},
+    "map_insurance_country": {"District": "TEXT", "Latitude": "DOUBLE PRECISION",
+                              "Longitude": "DOUBLE PRECISION", "Metric": "DOUBLE PRECISION"},
+    "map_insurance_hover": {"District": "TEXT", "Insurance_type": "TEXT",
+                            "Insurance_count": "BIGINT", "Insurance_amount": "DOUBLE PRECISION"},
+    "top_transaction_district": {"District": "TEXT", "Transaction_count": "BIGINT", "Transaction_amount": "DOUBLE PRECISION"},
+    "top_transaction_pincode": {"Pincode": "TEXT", "Transaction_count": "BIGINT", "Transaction_amount": "DOUBLE PRECISION"},
+    "top_user_district": {"District": "TEXT", "RegisteredUsers": "BIGINT"},
+    "top_user_pincode": {"Pincode": "TEXT", "RegisteredUsers": "BIGINT"},
+    "top_insurance_district": {"District": "TEXT", "Type": "TEXT", "Count": "BIGINT", "Amount": "DOUBLE PRECISION"},
+    "top_insurance_pincode": {"Pincode": "TEXT", "Type": "TEXT", "Count": "BIGINT", "Amount": "DOUBLE PRECISION"},
+}
+
+# the per-district/pincode fact tables; the agg_* and meta tables are one row per slice or type
+PARTITIONED_TABLES = [t for t in TABLES if t.startswith(("map_", "top_")) and t != "map_insurance_country_meta"]
+
+# Pulse publishes data from 2018; later years get a partition when reload_table sees them
+INITIAL_YEARS = range(2018, 2026)
+
+
+def columns(table):
+    return {**KEY_COLUMNS, **TABLES[table]}
+
+
+def partition_name(table, year):
+    return f"{table}_y{year}"
+
+
+def create_year_partitions(conn, table, years):
+    for year in years:
+        conn.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{partition_name(table, year)}" '
+            f'PARTITION OF "{table}" FOR VALUES IN ({int(year)})'
+        ))
+
+
+# ========================================
+# MIGRATIONS
+# ========================================
+def create_managed_tables(conn):
+    # tables created by to_sql(if_exists='replace') are renamed, copied into the managed
+    # table with their columns cast to the managed types, then dropped
+    existing = set(inspect(conn).get_table_names())
+    for table in TABLES:
+        cols = columns(table)
+        legacy = f"{table}_legacy"
+        if table in existing:
+            conn.execute(text(f'ALTER TABLE "{table}" RENAME TO "{legacy}"'))
+
+        col_defs = ", ".join(f'"{c}" {t}' for c, t in cols.items())
+        if table in PARTITIONED_TABLES:
+            conn.execute(text(f'CREATE TABLE "{table}" ({col_defs}) PARTITION BY LIST ("Year")'))
+            create_year_partitions(conn, table, INITIAL_YEARS)
+            conn.execute(text(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT'))
+        else:
+            conn.execute(text(f'CREATE TABLE "{table}" ({col_defs})'))
+
+        if table in existing:
+            col_list = ", ".join(f'"{c}"' for c in cols)
+            casts = ", ".join(f'CAST("{c}" AS {t})' for c, t in cols.items())
+            if table in PARTITIONED_TABLES:
+                years = conn.execute(text(f'SELECT DISTINCT CAST("Year" AS SMALLINT) FROM "{legacy}" WHERE "Year" IS NOT NULL')).scalars()
+                create_year_partitions(conn, table, years)
+            conn.execute(text(
+                f'INSERT INTO "{table}" ({col_list}) SELECT {casts} FROM "{legacy}" '
+                f'ORDER BY "State", CAST("Year" AS SMALLINT), CAST("Quarter" AS SMALLINT)'
+            ))
+            conn.execute(text(f'DROP TABLE "{legacy}"'))
+
+
+def create_indexes(conn):
+    for table in TABLES:
+        # on a partitioned table this creates a matching index on every partition
+        conn.execute(text(f'CREATE INDEX "{table}_state_year_quarter_idx" ON "{table}" ("State", "Year", "Quarter")'))
+    for table in TABLES:
+        conn.execute(text(f'ANALYZE "{table}"'))
+
+
+def drop_state_brin_indexes(conn):
+    # earlier versions of migration 2 also put a BRIN index on State; it only repeats the
+    # leading column of the B-tree above, so the planner never picked it
+    for table in TABLES:
+        conn.execute(text(f'DROP INDEX IF EXISTS "{table}_state_brin"'))
+
+
+MIGRATIONS = [
+    (1, "create managed tables partitioned by year", create_managed_tables),
+    (2, "add state/year/quarter btree indexes", create_indexes),
+    (3, "drop redundant state brin indexes", drop_state_brin_indexes),
+]
+
+
+def applied_migrations(conn):
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS schema_migrations ('
+        'version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TIMESTAMPTZ NOT NULL DEFAULT now())'
+    ))
+    return dict(conn.execute(text("SELECT version, name FROM schema_migrations")).all())
+
+
+def migrate(engine):
+    # each migration runs in its own transaction together with its bookkeeping row
+    with engine.begin() as conn:
+        done = applied_migrations(conn)
+    applied = []
+    for version, name, upgrade in MIGRATIONS:
+        if version in done:
+            continue
+        with engine.begin() as conn:
+            upgrade(conn)
+            conn.execute(text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                         {"version": version, "name": name})
+        applied.append((version, name))
+    return applied
+
+
+def reload_table(df, table, engine):
+    # replaces the rows of a managed table, keeping its partitions and indexes
+    df = df.copy()
+    for col in KEY_COLUMNS:
+        if col != "State":
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int16")
+    df = df.sort_values(list(KEY_COLUMNS))
+    with engine.begin() as conn:
+        conn.execute(text(f'TRUNCATE "{table}"'))
+        if table in PARTITIONED_TABLES:
+            create_year_partitions(conn, table, df["Year"].dropna().unique())
+        df.to_sql(table, conn, if_exists="append", index=False, chunksize=10000)
+        conn.execute(text(f'ANALYZE "{table}"'))
+
+
+if __name__ == "__main__":
+    from db_connect import engine
+
+    parser = argparse.ArgumentParser(description="Apply schema migrations to the PhonePe database")
+    parser.add_argument("--status", action="store_true", help="list applied migrations and exit")
+    args = parser.parse_args()
+
+    if args.status:
+        with engine.begin() as conn:
+            for version, name in sorted(applied_migrations(conn).items()):
+                print(f"{version:>3}  {name}")
+    else:
+        applied = migrate(engine)
+        for version, name in applied:
+            print(f"✅ applied migration {version}: {name}")
+        if not applied:
+            print("Schema is up to date.")
@@ -0,0 +1,141 @@
+'''
+Cold-start measurement for new replicas.
+
+Every number comes from a fresh interpreter, so nothing is cached:
+
+- import cost of each module the app loads, on top of an already imported
+  streamlit (a replica's server process has imported it before the first run)
+- boot: from process creation to a headless `streamlit run app.py` answering
+  its health endpoint, i.e. until the replica could accept a first session
+- first session of every view: the first app.py run in a process that has
+  imported streamlit, through Streamlit's AppTest against the synthetic
+  SQLite database used by loadtest.py
+
+Boot and first session are reported apart; on a live replica they are
+separated by however long it waits for its first visitor.
+
+    python startup_bench.py
+    python startup_bench.py --repeat 5 --json startup.json
+
+The running app also logs its own first session (see timing.py).
+'''
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import psutil
+
+import synthetic_data
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(HERE, "app.py")
+
+MODULES = [
+    "pandas", "sqlalchemy", "plotly.express", "pydeck",
+    "db_connect", "analysis", "data",
+    "views.overview", "views.top_districts", "views.top_pincodes", "views.top_users",
+    "views.transaction_map", "views.insurance", "views.compare",
+]
+VIEWS = ["Overview", "Top Districts", "Top Pincodes", "Top Users", "Transaction Map", "Insurance Insights", "Compare"]
+
+IMPORT_PROBE = '''
+import sys, time
+import streamlit
+start = time.perf_counter()
+__import__(sys.argv[1])
+print(time.perf_counter() - start)
+'''
+
+FIRST_SESSION_PROBE = '''
+import sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.session_state["view"] = sys.argv[2]
+start = time.perf_counter()
+at.run()
+print(time.perf_counter() - start, len(at.exception))
+'''
+
+
+def probe(code, *args):
+    result = subprocess.run([sys.executable, "-c", code, *args], cwd=HERE, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(result.stderr)
+    return result.stdout.split()
+
+
+def boot_ms(timeout=120):
+    # process creation of `streamlit run` until /_stcore/health answers
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless", "true",
+         "--server.address", "127.0.0.1", "--server.port", str(port)],
+        cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        created = psutil.Process(server.pid).create_time()
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if server.poll() is not None:
+                raise SystemExit(f"streamlit run exited with {server.returncode} before it was ready")
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+                return (time.time() - created) * 1000
+            except OSError:
+                time.sleep(0.02)
+        raise SystemExit(f"streamlit run was not ready after {timeout} s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import costs, boot and first session per view")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per measurement; the median is reported")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = {"imports_ms": {}, "boot_ms": None, "first_session_ms": {}}
+
+    print("Import cost after streamlit (ms):")
+    for module in MODULES:
+        runs = [float(probe(IMPORT_PROBE, module)[0]) * 1000 for _ in range(args.repeat)]
+        results["imports_ms"][module] = statistics.median(runs)
+        print(f"  {module:<24}{results['imports_ms'][module]:>10,.1f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{os.path.join(tmp, 'phonepe_startup.db')}"
+        synthetic_data.write_tables(db_url, synthetic_data.build_tables())
+        os.environ["PHONEPE_DB_URL"] = db_url
+        os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+        results["boot_ms"] = statistics.median(boot_ms() for _ in range(args.repeat))
+        print(f"Boot, process start to server ready (ms): {results['boot_ms']:,.1f}")
+
+        print("First session per view, fresh process (ms):")
+        for view in VIEWS:
+            runs = []
+            for _ in range(args.repeat):
+                elapsed, errors = probe(FIRST_SESSION_PROBE, APP_PATH, view)
+                if int(errors):
+                    raise SystemExit(f"{view} raised {errors} exception(s) on first run")
+                runs.append(float(elapsed) * 1000)
+            results["first_session_ms"][view] = statistics.median(runs)
+            print(f"  {view:<24}{results['first_session_ms'][view]:>10,.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+'''
+Synthetic PhonePe Pulse tables for offline runs (load tests, benchmarks).
+Same table names and columns as the ones caseStudy.ipynb loads into PostgreSQL.
+'''
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+STATES = [
+    'andaman-&-nicobar-islands', 'andhra-pradesh', 'arunachal-pradesh', 'assam', 'bihar',
+    'chandigarh', 'chhattisgarh', 'dadra-&-nagar-haveli-&-daman-&-diu', 'delhi', 'goa',
+    'gujarat', 'haryana', 'himachal-pradesh', 'jammu-&-kashmir', 'jharkhand', 'karnataka',
+    'kerala', 'ladakh', 'madhya-pradesh', 'maharashtra', 'manipur', 'meghalaya', 'mizoram',
+    'nagaland', 'odisha', 'puducherry', 'punjab', 'rajasthan', 'sikkim', 'tamil-nadu',
+    'telangana', 'tripura', 'uttar-pradesh', 'uttarakhand', 'west-bengal', 'lakshadweep'
+]
+YEARS = [2018, 2019, 2020, 2021, 2022, 2023, 2024]
+QUARTERS = [1, 2, 3, 4]
+
+TRANSACTION_TYPES = ['Recharge & bill payments', 'Peer-to-peer payments', 'Merchant payments',
+                     'Financial Services', 'Others']
+BRANDS = ['Xiaomi', 'Samsung', 'Vivo', 'Oppo', 'Realme', 'Apple', 'Motorola', 'OnePlus',
+          'Huawei', 'Others']
+PERCENTILES = ['P10', 'P20', 'P30', 'P40', 'P50', 'P60', 'P80', 'P90', 'P99_5']
+
+
+def slice_grid(per_slice=1):
+    # one row per (State, Year, Quarter), repeated per_slice times
+    grid = pd.MultiIndex.from_product([STATES, YEARS, QUARTERS], names=['State', 'Year', 'Quarter'])
+    df = grid.to_frame(index=False)
+    return df.loc[df.index.repeat(per_slice)].reset_index(drop=True)
+
+
+def with_labels(df, col, labels):
+    # cycle a fixed list of labels within every slice
+    df[col] = np.array(labels)[df.groupby(['State', 'Year', 'Quarter']).cumcount() % len(labels)]
+    return df
+
+
+def entity_slots(df, per_state):
+    # per-state entity ids so the same district/pincode recurs across periods
+    state_idx = df['State'].map({s: i for i, s in enumerate(STATES)})
+    slot = df.groupby(['State', 'Year', 'Quarter']).cumcount() % per_state
+    return state_idx, slot
+
+
+def build_tables(districts_per_state=10, pincodes_per_district=10, seed=42):
+    rng = np.random.default_rng(seed)
+    tables = {}
+
+    def amounts(n, scale=1e6):
+        return rng.lognormal(mean=np.log(scale), sigma=1.0, size=n).round(2)
+
+    def counts(n, scale=1e4):
+        return rng.poisson(lam=scale, size=n)
+
+    df = with_labels(slice_grid(len(TRANSACTION_TYPES)), 'Transaction_type', TRANSACTION_TYPES)
+    df.insert(3, 'From', 0)
+    df.insert(4, 'To', 0)
+    df['Transaction_count'] = counts(len(df))
+    df['Transaction_amount'] = amounts(len(df), 1e8)
+    tables['agg_transaction'] = df
+
+    df = slice_grid()
+    df['RegisteredUsers'] = counts(len(df), 1e6)
+    df['AppOpens'] = counts(len(df), 1e7)
+    tables['agg_user'] = df
+
+    df = with_labels(slice_grid(len(BRANDS)), 'Brand', BRANDS)
+    df['Count'] = counts(len(df), 1e5)
+    df['Percentage'] = df['Count'] / df.groupby(['State', 'Year', 'Quarter'])['Count'].transform('sum')
+    tables['agg_user_device'] = df
+
+    df = slice_grid(districts_per_state)
+    _, slot = entity_slots(df, districts_per_state)
+    df['District'] = df['State'] + ' district ' + slot.astype(str)
+    districts = df
+
+    n_pincodes = districts_per_state * pincodes_per_district
+    pins = slice_grid(n_pincodes)
+    state_idx, slot = entity_slots(pins, n_pincodes)
+    pins['Pincode'] = (100000 + state_idx * 10000 + slot).astype(str)
+
+    df = districts.copy()
+    df['Transaction_count'] = counts(len(df))
+    df['Transaction_amount'] = amounts(len(df), 1e7)
+    tables['top_transaction_district'] = df
+
+    df = pins.copy()
+    df['Transaction_count'] = counts(len(df), 1e3)
+    df['Transaction_amount'] = amounts(len(df), 1e5)
+    tables['top_transaction_pincode'] = df
+
+    df = districts.copy()
+    df['RegisteredUsers'] = counts(len(df), 1e5)
+    tables['top_user_district'] = df
+
+    df = pins.copy()
+    df['RegisteredUsers'] = counts(len(df), 1e3)
+    tables['top_user_pincode'] = df
+
+    df = slice_grid()
+    df.insert(3, 'From', 0)
+    df.insert(4, 'To', 0)
+    df['Type'] = 'TOTAL'
+    df['Transaction_count'] = counts(len(df), 1e3)
+    df['Transaction_amount'] = amounts(len(df), 1e6)
+    tables['agg_insurance'] = df
+
+    df = districts.copy()
+    df['Latitude'] = rng.uniform(8.0, 34.0, len(df)).round(4)
+    df['Longitude'] = rng.uniform(69.0, 96.0, len(df)).round(4)
+    df['Metric'] = counts(len(df), 1e2)
+    tables['map_insurance_country'] = df[['State', 'Year', 'Quarter', 'District', 'Latitude', 'Longitude', 'Metric']]
+
+    df = slice_grid()
+    df['DataLevel'] = 'state'
+    df['GridLevel'] = 'district'
+    base = rng.uniform(1, 10, len(df))
+    for i, p in enumerate(PERCENTILES):
+        df[p] = (base * (i + 1)).round(2)
+    tables['map_insurance_country_meta'] = df
+
+    df = districts.copy()
+    df['Insurance_type'] = 'TOTAL'
+    df['Insurance_count'] = counts(len(df), 1e2)
+    df['Insurance_amount'] = amounts(len(df), 1e5)
+    tables['map_insurance_hover'] = df
+
+    df = districts.copy()
+    df['Type'] = 'TOTAL'
+    df['Count'] = counts(len(df), 1e2)
+    df['Amount'] = amounts(len(df), 1e5)
+    tables['top_insurance_district'] = df
+
+    df = pins.copy()
+    df['Type'] = 'TOTAL'
+    df['Count'] = counts(len(df), 10)
+    df['Amount'] = amounts(len(df), 1e4)
+    tables['top_insurance_pincode'] = df
+
+    return tables
+
+
+def write_tables(db_url, tables):
+    engine = create_engine(db_url)
+    for name, df in tables.items():
+        df.to_sql(name, engine, if_exists='replace', index=False)
+    engine.dispose()
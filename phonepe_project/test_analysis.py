@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import (
+    batch_slice_kpis, comparison_slices, filter_data, get_kpis, transaction_by_type, transaction_cube, year_quarters
+)
+
+
+@pytest.fixture
+def raw():
+    # two full years and a partial latest year (Q1, Q2 only), like a Pulse snapshot mid-year
+    rng = np.random.default_rng(0)
+    periods = [(y, q) for y in (2022, 2023) for q in (1, 2, 3, 4)] + [(2024, 1), (2024, 2)]
+    rows = [(s, y, q, t) for s in ['goa', 'kerala', 'assam'] for y, q in periods
+            for t in ['Recharge', 'Peer-to-peer payments', 'Merchant payments']]
+    df = pd.DataFrame(rows * 3, columns=['State', 'Year', 'Quarter', 'Transaction_type'])
+    df['Transaction_amount'] = rng.lognormal(10, 1, len(df))
+    df['Transaction_count'] = rng.integers(1, 1000, len(df))
+    return df
+
+
+def test_missing_period_has_no_comparison(raw):
+    cube = transaction_cube(raw)
+    assert comparison_slices(cube, "Quarter vs Previous Quarter", "goa", 2024, 3) is None
+    assert comparison_slices(cube, "Quarter vs Previous Quarter", "goa", 2030, 1) is None
+    assert comparison_slices(cube, "Year vs Previous Year", "goa", 2030, "All") is None
+
+
+def test_first_period_has_no_baseline(raw):
+    cube = transaction_cube(raw)
+    assert comparison_slices(cube, "Quarter vs Previous Quarter", "kerala", 2022, 1) is None
+    assert comparison_slices(cube, "Year vs Previous Year", "kerala", 2022, "All") is None
+
+
+def test_partial_latest_year(raw):
+    cube = transaction_cube(raw)
+    assert year_quarters(cube, 2024) == [1, 2]
+    assert year_quarters(cube, 2023) == [1, 2, 3, 4]
+    assert comparison_slices(cube, "Quarter vs Previous Quarter", "goa", 2024, 1) == (("goa", 2024, 1), ("goa", 2023, 4))
+    assert comparison_slices(cube, "Year vs Previous Year", "goa", 2024, 2) == (("goa", 2024, "All"), ("goa", 2023, "All"))
+    assert comparison_slices(cube, "State vs National", "goa", 2024, 2) == (("goa", 2024, 2), ("All", 2024, 2))
+
+
+def test_batch_kpis_match_filtering_the_raw_rows(raw):
+    slices = [("All", "All", "All"), ("goa", "All", "All"), ("All", 2024, "All"), ("All", "All", 3),
+              ("kerala", 2023, 4), ("assam", 2024, "All"), ("goa", 2024, 3)]
+    results = batch_slice_kpis(transaction_cube(raw), slices)
+    assert [r['slice'] for r in results] == slices
+    for r in results:
+        part = filter_data(raw, *r['slice'])
+        amount, count, types = r['kpis']
+        expected_amount, expected_count, expected_types = get_kpis(part)
+        assert np.isclose(amount, expected_amount)
+        assert count == expected_count
+        assert types == expected_types
+        pd.testing.assert_series_equal(r['by_type'].sort_index(), transaction_by_type(part).sort_index())
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from analysis import build_slice_sketches, filter_data, slice_rollup
+from sketches import HyperLogLog
+
+
+def test_hll_merge_equals_sketch_of_union():
+    a = HyperLogLog().add(np.arange(0, 6000))
+    b = HyperLogLog().add(np.arange(4000, 10000))
+    union = HyperLogLog().add(np.arange(0, 10000))
+    merged = HyperLogLog.merge_all([a, b])
+    assert np.array_equal(merged.registers, union.registers)
+    assert abs(merged.estimate() - 10000) <= 4 * merged.relative_error * 10000
+
+
+def test_hll_small_cardinalities_are_near_exact():
+    assert round(HyperLogLog().add(["UPI", "Cards", "Wallet", "UPI"]).estimate()) == 3
+
+
+def test_rollups_match_sketches_of_the_filtered_rows():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'State': rng.choice(['goa', 'kerala', 'assam'], 600),
+        'Year': rng.choice([2022, 2023], 600),
+        'Quarter': rng.choice([1, 2, 3, 4], 600),
+        'Type': rng.choice(list('ABCDEFGH'), 600),
+        'Transaction_amount': rng.lognormal(10, 1, 600),
+        'Transaction_count': rng.integers(1, 100, 600),
+    })
+    sketches = build_slice_sketches(df, sum_cols=['Transaction_amount', 'Transaction_count'], distinct_col='Type')
+    # every "All"/value selection, including the national total
+    assert len(sketches) == 4 * 3 * 5
+    for selection in [("All", "All", "All"), ("goa", "All", "All"), ("All", 2023, "All"), ("All", "All", 2), ("kerala", 2022, 4)]:
+        part = filter_data(df, *selection)
+        rollup = slice_rollup(sketches, *selection)
+        assert np.isclose(rollup['sums']['Transaction_amount'], part['Transaction_amount'].sum())
+        assert rollup['sums']['Transaction_count'] == part['Transaction_count'].sum()
+        assert np.issubdtype(type(rollup['sums']['Transaction_count']), np.integer)
+        assert np.array_equal(rollup['distinct'].registers, HyperLogLog().add(part['Type']).registers)
+    assert slice_rollup(sketches, "goa", 2030, "All") is None
@@ -0,0 +1,26 @@
+'''
+Script-run timing. The first run in a process is the first session a new
+replica serves; it is logged on its own, covering the script run and the lazy
+imports of the view it opens. Booting the server (interpreter start-up,
+importing streamlit, binding the port) happens before any session exists, so
+it is measured separately by startup_bench.py, which times `streamlit run`
+from process creation to its health endpoint answering. Neither number
+includes the time a replica sat idle waiting for its first visitor.
+'''
+import time
+
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+first_session = {}
+
+
+def record_run(view, started):
+    # started: time.perf_counter() at the top of app.py, for the script run itself
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if not first_session:
+        first_session.update(view=view, run_ms=elapsed_ms)
+        logger.info("first session: %s view rendered in %.0f ms (script run incl. lazy imports)", view, elapsed_ms)
+    else:
+        logger.debug("rerun: %s view rendered in %.0f ms", view, elapsed_ms)
+    return elapsed_ms
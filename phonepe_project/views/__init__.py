@@ -0,0 +1,9 @@
+'''
+Dashboard views. app.py imports a view module the first time it is opened,
+so plotly, pydeck and each view's code load only when needed.
+Every module exposes render(approx_mode).
+'''
+
+
+def distinct_error_note(relative_error):
+    return f"≈ HyperLogLog estimate, ±{2 * relative_error:.1%} at 95% confidence"
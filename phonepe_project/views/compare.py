@@ -0,0 +1,84 @@
+'''
+Compare view: two State/Year/Quarter slices side by side.
+'''
+import streamlit as st
+import plotly.express as px
+
+import data
+from analysis import batch_slice_kpis, comparison_slices, comparison_frame, slice_label, year_quarters
+
+
+def render(approx_mode):
+    st.title("⚖️ Compare Periods & States")
+
+    cube = data.transaction_cube()
+    compare_mode = st.sidebar.radio("Compare", ["Quarter vs Previous Quarter", "Year vs Previous Year", "State vs National"], key="cmp_mode")
+
+    states = ["All"] + sorted(cube["State"].dropna().unique().tolist())
+    years = sorted(cube["Year"].dropna().unique().tolist())
+
+    selected_state = st.sidebar.selectbox("Select State", states, key="cmp_state")
+    selected_year = st.sidebar.selectbox("Select Year", years, index=len(years) - 1, key="cmp_year")
+    # only quarters that exist: the latest year is usually partial
+    quarters = year_quarters(cube, selected_year)
+    if compare_mode == "Quarter vs Previous Quarter":
+        selected_quarter = st.sidebar.selectbox("Select Quarter", quarters, key="cmp_qtr")
+    elif compare_mode == "State vs National":
+        selected_quarter = st.sidebar.selectbox("Select Quarter", ["All"] + quarters, key="cmp_qtr_all")
+    else:
+        selected_quarter = "All"
+
+    slices = comparison_slices(cube, compare_mode, selected_state, selected_year, selected_quarter)
+    if compare_mode == "State vs National" and selected_state == "All":
+        st.info("Pick a state to compare it against the national total.")
+    elif slices is None:
+        st.info("No earlier period in the data to compare with.")
+    else:
+        if compare_mode == "Year vs Previous Year":
+            current_quarters = year_quarters(cube, selected_year)
+            baseline_year = slices[1][1]
+            baseline_quarters = year_quarters(cube, baseline_year)
+            if len(current_quarters) < len(baseline_quarters):
+                st.warning(f"{selected_year} only has data for {', '.join(f'Q{q}' for q in current_quarters)} so far, "
+                           f"against {', '.join(f'Q{q}' for q in baseline_quarters)} for {baseline_year}: "
+                           "the totals are not like for like.")
+
+        current, baseline = batch_slice_kpis(cube, slices)
+        current_amount, current_count, current_types = current["kpis"]
+        baseline_amount, baseline_count, baseline_types = baseline["kpis"]
+
+        def change(now, before):
+            if compare_mode == "State vs National":
+                return f"{now / before:.1%} of national" if before else None
+            return f"{(now - before) / before:+.1%}" if before else None
+
+        delta_color = "off" if compare_mode == "State vs National" else "normal"
+        col1, col2 = st.columns(2)
+        col1.markdown(f"#### {slice_label(*current['slice'])}")
+        col1.metric("💰 Total Transaction Amount", f"₹{current_amount:,.0f}", delta=change(current_amount, baseline_amount), delta_color=delta_color, border=True)
+        col1.metric("🔁 Total Transaction Count", f"{current_count:,}", delta=change(current_count, baseline_count), delta_color=delta_color, border=True)
+        col1.metric("🔣 Transaction Types", current_types, border=True)
+        col2.markdown(f"#### {slice_label(*baseline['slice'])}")
+        col2.metric("💰 Total Transaction Amount", f"₹{baseline_amount:,.0f}", border=True)
+        col2.metric("🔁 Total Transaction Count", f"{baseline_count:,}", border=True)
+        col2.metric("🔣 Transaction Types", baseline_types, border=True)
+
+        st.divider()
+
+        st.markdown("### 💡 Transaction Breakdown by Type")
+        chart_df = comparison_frame([current, baseline])
+        if not chart_df.empty:
+            fig = px.bar(
+                chart_df,
+                x="Transaction_type",
+                y="Transaction_amount",
+                color="Slice",
+                barmode="group",
+                labels={"Transaction_type": "Transaction Type", "Transaction_amount": "Total Amount (₹)", "Slice": ""},
+                title="Transaction Amount per Type",
+                color_discrete_sequence=["#F39C12", "#2E86C1"]
+            )
+            fig.update_layout(xaxis_tickangle=-30)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No transaction data found for the selected slices.")
@@ -0,0 +1,212 @@
+'''
+Insurance Insights view.
+'''
+import streamlit as st
+import plotly.express as px
+import pydeck as pdk
+
+import data
+from analysis import insurance_kpis, insurance_by_type, approx_kpis, slice_rollup
+from views import distinct_error_note
+
+
+def render(approx_mode):
+    agg_ins_df = data.load("agg_insurance")
+
+    st.title("🏥 Insurance Insights Dashboard")
+
+    states = ["All"] + sorted(agg_ins_df["State"].dropna().unique())
+    years = ["All"] + sorted(agg_ins_df["Year"].dropna().unique())
+    quarters = ["All"] + sorted(agg_ins_df["Quarter"].dropna().unique())
+
+    selected_state = st.sidebar.selectbox("Select State", states, key="ins_state")
+    selected_year = st.sidebar.selectbox("Select Year", years, key="ins_year")
+    selected_quarter = st.sidebar.selectbox("Select Quarter", quarters, key="ins_qtr")
+
+    # Filter insurance data
+    filtered_ins = data.load("agg_insurance", selected_state, selected_year, selected_quarter)
+
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📌 Overview", "📍 Regional Insights", "🗃️ Raw Data", "📈 Trends", "🗺️ Map", "📊 Penetration Analysis"])
+
+    with tab1:
+        st.subheader("💡 Key Metrics")
+        if approx_mode:
+            kpis = approx_kpis(slice_rollup(data.sketches("insurance"), selected_state, selected_year, selected_quarter))
+        else:
+            kpis = insurance_kpis(filtered_ins) if not filtered_ins.empty else None
+
+        if kpis is not None:
+            total_amount, total_count, unique_types = kpis[:3]
+            col1, col2, col3 = st.columns([1, 1, 1])
+            col1.metric("💵 Total Insurance Amount", f"₹{total_amount:,.0f}", border=True)
+            col2.metric("📑 Total Policies", f"{total_count:,}", border=True)
+            col3.metric("🔢 Types of Insurance", unique_types, border=True)
+            if approx_mode:
+                st.caption(distinct_error_note(kpis[3]))
+            st.divider()
+            # Show chart only if more than one insurance type
+            insurance_types = filtered_ins["Type"].dropna().unique()
+            if len(insurance_types) > 1:
+                st.subheader("🧾 Insurance Amount by Type")
+                chart_data = insurance_by_type(filtered_ins)
+                fig = px.bar(
+                    chart_data,
+                    x="Type",
+                    y="Transaction_amount",
+                    color="Type",
+                    labels={"Transaction_amount": "Total Amount (₹)", "Type": "Insurance Type"},
+                    title="Breakdown by Insurance Type",
+                    color_discrete_sequence=px.colors.sequential.Blues
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info(f"ℹ️ Only one insurance type found: **{insurance_types[0]}**. Skipping type chart.")
+        else:
+            st.warning("No data for selected filters.")
+
+    # Regional Insights Tab
+    with tab2:
+        st.subheader("🏙️ Top Districts by Insurance Amount")
+        district_data = data.load("top_insurance_district", selected_state, selected_year, selected_quarter)
+        if not district_data.empty:
+            top_districts = district_data.groupby("District")["Amount"].sum().sort_values(ascending=False).head(10).reset_index()
+            fig = px.bar(
+                top_districts,
+                x="District",
+                y="Amount",
+                labels={"Amount": "Amount (₹)", "District": "District"},
+                title="Top 10 Districts",
+                color="Amount",
+                color_continuous_scale="Purples"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No district-level data available.")
+        st.divider()
+        st.subheader("📮 Top Pincodes by Insurance Amount")
+        top_pins = data.top_k("top_insurance_pincode", "Pincode", "Amount", selected_state, selected_year, selected_quarter).reset_index()
+        if not top_pins.empty:
+            top_pins["Pincode"] = top_pins["Pincode"].astype(str)
+            fig = px.bar(
+                top_pins,
+                x="Pincode",
+                y="Amount",
+                labels={"Amount": "Amount (₹)", "Pincode": "Pincode"},
+                title="Top 10 Pincodes",
+                color="Amount",
+                color_continuous_scale="Oranges"
+            )
+            fig.update_layout(
+                xaxis=dict(
+                    tickmode='linear',
+                    tickformat='',
+                    type='category'  # force categorical x-axis
+                )
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No pincode-level data available.")
+
+    # Raw Data Tab
+    with tab3:
+        st.subheader("📄 Filtered Insurance Data")
+        st.dataframe(filtered_ins)
+
+    # Trend
+    with tab4:
+        st.subheader("📈 Insurance Trend Over Time")
+
+        if not filtered_ins.empty:
+
+            trend_df = filtered_ins.copy()
+            trend_df["YearQuarter"] = trend_df["Year"].astype(str) + " Q" + trend_df["Quarter"].astype(str)
+            trend_summary = trend_df.groupby("YearQuarter")["Transaction_amount"].sum().reset_index()
+
+            # Plot line chart using Plotly
+            fig = px.line(
+                trend_summary,
+                x="YearQuarter",
+                y="Transaction_amount",
+                title="📊 Insurance Transaction Trend Over Time",
+                markers=True,
+                labels={"Transaction_amount": "Amount (₹)", "YearQuarter": "Period"},
+                line_shape="spline"
+            )
+            fig.update_traces(line_color="#FF6F00", marker=dict(size=8))
+            fig.update_layout(xaxis_tickangle=-30)
+
+            st.plotly_chart(fig, use_container_width=True)
+
+            st.info("💡 *Insight:* Sudden spikes or drops may indicate seasonal trends, new product launches, or policy shifts.")
+        else:
+            st.warning("No trend data available for selected filters.")
+
+    # Map
+    with tab5:
+        st.subheader("🗺️ Insurance Transaction Map")
+        filtered_map = data.load("map_insurance_country", selected_state, selected_year, selected_quarter)
+
+        if not filtered_map.empty:
+            district_summary = filtered_map.groupby(["District", "Latitude", "Longitude"])["Metric"].sum().reset_index()
+
+            district_summary = district_summary.sort_values("Metric", ascending=False).head(40000)
+
+            # Bubble Map using PyDeck
+            max_metric = district_summary["Metric"].max()
+            district_summary["radius"] = district_summary["Metric"] / max_metric * 50000  # scale radius
+
+            district_summary["color"] = district_summary["Metric"].apply(
+                lambda x: [255, int(255 - (x / max_metric) * 200), 0, 140]
+            )
+
+            layer = pdk.Layer(
+                "ScatterplotLayer",
+                data=district_summary,
+                get_position='[Longitude, Latitude]',
+                get_radius="radius",
+                get_fill_color="color",
+                pickable=True,
+                auto_highlight=True,
+            )
+
+            view_state = pdk.ViewState(
+                latitude=district_summary["Latitude"].mean(),
+                longitude=district_summary["Longitude"].mean(),
+                zoom=5,
+                pitch=0,
+            )
+
+            st.pydeck_chart(pdk.Deck(
+                layers=[layer],
+                initial_view_state=view_state,
+                tooltip={"text": "{District}\nMetric: {Metric}"}
+            ))
+
+            st.info("💡 *Insight:* Larger bubbles represent higher insurance transaction activity in those districts.")
+
+        else:
+            st.warning("No insurance map data available for selected filters.")
+
+    # Penetration
+    with tab6:
+        st.subheader("📊 Insurance Penetration by State")
+        filtered_meta = data.load("map_insurance_country_meta", selected_state, selected_year, selected_quarter)
+
+        if not filtered_meta.empty:
+            percentiles = ["P10", "P20", "P30", "P40", "P50", "P60", "P80", "P90", "P99_5"]
+            melted_df = filtered_meta.melt(id_vars=["State"], value_vars=percentiles, var_name="Percentile", value_name="Value")
+
+            fig = px.line(
+                melted_df,
+                x="Percentile",
+                y="Value",
+                color="State",
+                markers=True,
+                title="📈 Insurance Penetration Across States (Percentile View)"
+            )
+            fig.update_layout(xaxis_title="Percentile Level", yaxis_title="Penetration Value")
+            st.plotly_chart(fig, use_container_width=True)
+
+            st.info("💡 *Insight:* States with steep percentile curves have unequal insurance adoption — growth campaigns can focus on lower percentile regions.")
+        else:
+            st.warning("No penetration data found for selected filters.")
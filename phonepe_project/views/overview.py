@@ -0,0 +1,216 @@
+'''
+Overview view: transaction KPIs, type breakdown, users & devices, trends and raw data.
+'''
+import streamlit as st
+import plotly.express as px
+
+import data
+from analysis import (
+    get_kpis, transaction_by_type,
+    user_kpis, device_usage, get_transaction_trend, approx_kpis, slice_rollup
+)
+from views import distinct_error_note
+
+
+def render(approx_mode):
+    agg_transaction_df = data.load("agg_transaction")
+
+    st.title("📊 PhonePe Transaction Insights")
+
+    # Sidebar filters
+    states = ["All"] + sorted(agg_transaction_df['State'].dropna().unique().tolist())
+    years = ["All"] + sorted(agg_transaction_df['Year'].unique().tolist())
+    quarters = ["All", 1, 2, 3, 4]
+
+    selected_state = st.sidebar.selectbox("Select State", states)
+    selected_year = st.sidebar.selectbox("Select Year", years)
+    selected_quarter = st.sidebar.selectbox("Select Quarter", quarters)
+
+    # Filter data
+    filtered_trans = data.load("agg_transaction", selected_state, selected_year, selected_quarter)
+    filtered_user = data.load("agg_user", selected_state, selected_year, selected_quarter)
+    filtered_device = data.load("agg_user_device", selected_state, selected_year, selected_quarter)
+
+    # Tabs for organization
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📌 KPIs", "💡 Transaction Types", "👥 Users & Devices", "📈 Trends", "📂 Raw Data"])
+
+    # with tab1:
+    #     # Transaction KPIs
+    #     if not filtered_trans.empty:
+    #         st.subheader("📌 Transaction Overview")
+    #         total_amount, total_count, unique_types = get_kpis(filtered_trans)
+    #         col1, col2, col3 = st.columns([2,2,1])
+    #         col1.metric("💰 Total Transaction Amount", f"₹{total_amount:,.0f}", border=True)
+    #         col2.metric("🔁 Total Transaction Count", f"{total_count:,}", border=True)
+    #         col3.metric("🔣 Transaction Types", unique_types, border=True)
+
+    #         st.subheader("💡 Transaction Amount by Type")
+    #         chart_data = transaction_by_type(filtered_trans)
+    #         if not chart_data.empty:
+    #             st.bar_chart(chart_data)
+    #         else:
+    #             st.info("No chart data available for selected filters.")
+    #     else:
+    #         st.warning("No transaction data found for selected filters.")
+    with tab1:
+        st.subheader("📌 Transaction Overview")
+
+        # None when nothing matches the filters; approximate mode reads that from the sketch rollup
+        if approx_mode:
+            kpis = approx_kpis(slice_rollup(data.sketches("transaction"), selected_state, selected_year, selected_quarter))
+        else:
+            kpis = get_kpis(filtered_trans) if not filtered_trans.empty else None
+
+        if kpis is not None:
+            # KPIs with better visual balance and professional look
+            total_amount, total_count, unique_types = kpis[:3]
+            st.markdown("### 🔢 Key Performance Indicators")
+
+            col1, col2, col3 = st.columns([2, 2, 1])
+            col1.metric("💰 Total Transaction Amount", f"₹{total_amount:,.0f}", help="Sum of all transactions", border=True)
+            col2.metric("🔁 Total Transaction Count", f"{total_count:,}", help="Number of transactions", border=True)
+            col3.metric("🔣 Transaction Types", unique_types, help="Unique transaction modes used", border=True)
+            if approx_mode:
+                st.caption(distinct_error_note(kpis[3]))
+
+            st.divider()
+
+            # Bar Chart of Amount by Transaction Type
+            st.markdown("### 💡 Transaction Breakdown by Type")
+
+            chart_data = transaction_by_type(filtered_trans)
+            if not chart_data.empty:
+                fig = px.bar(
+                    chart_data,
+                    x=chart_data.index,
+                    y=chart_data.values,
+                    labels={"x": "Transaction Type", "y": "Total Amount (₹)"},
+                    title="Transaction Amount per Type",
+                    color_discrete_sequence=["#F39C12"]
+                )
+                fig.update_layout(xaxis_tickangle=-30)
+                st.plotly_chart(fig, use_container_width=True)
+
+                # Optional Insight Box
+                st.info("💡 *Insight:* Transaction types like 'Recharge' or 'Merchant Payments' can reveal usage trends across regions or periods.")
+            else:
+                st.info("No chart data available for selected filters.")
+        else:
+            st.warning("No transaction data found for selected filters.")
+
+    with tab2:
+        st.subheader("👥 User Overview")
+
+        if not filtered_user.empty or not filtered_device.empty:
+            # Show KPIs
+            if not filtered_user.empty:
+                total_app_opens, total_users = user_kpis(filtered_user)
+                col1, col2, col3 = st.columns([1, 1, 2])
+                col1.metric("📱 App Opens", f"{total_app_opens:,}",  border=True)
+                col2.metric("🧑 Registered Users", f"{total_users:,}", border=True)
+                col3.markdown("#### 🔍 Insight:")
+                col3.markdown(f"""
+                    - The number of app opens helps understand **user engagement**
+                    - High user count means strong **market penetration**
+                    - Use filters (state/year/quarter) to explore more
+                """)
+            else:
+                st.warning("No user data available for the selected filters.")
+
+            st.divider()
+
+            # Device Usage Chart
+            if not filtered_device.empty:
+                st.subheader("📱 Device Usage Distribution")
+                device_data = device_usage(filtered_device)
+                if not device_data.empty:
+                    fig = px.bar(
+                        device_data,
+                        x=device_data.index,
+                        y=device_data.values,
+                        labels={'x': 'Device Brand', 'y': 'App Opens'},
+                        title="App Opens by Device Brand",
+                        color_discrete_sequence=["#FF6F00"]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("No device usage data found for selected filters.")
+            else:
+                st.warning("No device data available for the selected filters.")
+        else:
+            st.warning("No user or device data available.")
+
+    with tab3:
+        st.subheader("📱 Device Usage Overview")
+
+        if not filtered_device.empty:
+            device_data = device_usage(filtered_device)
+
+            if not device_data.empty:
+                # Top 3 Devices as metrics
+                sorted_devices = device_data.sort_values(ascending=False)
+                top_devices = sorted_devices.head(3)
+                st.markdown("### 🔝 Top Device Brands")
+                col1, col2, col3 = st.columns(3)
+                col1.metric(f"🥇 {top_devices.index[0]}", f"{top_devices.iloc[0]:,} Opens",  border=True)
+                col2.metric(f"🥈 {top_devices.index[1]}", f"{top_devices.iloc[1]:,} Opens",  border=True)
+                col3.metric(f"🥉 {top_devices.index[2]}", f"{top_devices.iloc[2]:,} Opens",  border=True)
+
+                st.divider()
+
+                # Plotly Bar Chart
+                fig = px.bar(
+                    device_data.sort_values(ascending=False),
+                    x=device_data.index,
+                    y=device_data.values,
+                    labels={"x": "Device Brand", "y": "App Opens"},
+                    title="📊 App Opens by Device Brand",
+                    color_discrete_sequence=["#2E86C1"]
+                )
+                fig.update_layout(xaxis_tickangle=-45)
+                st.plotly_chart(fig, use_container_width=True)
+
+                # Optional Insights
+                st.info("💡 *Insight:* A dominant brand indicates strong performance or popularity in that region/period. Use this to target specific device users with campaigns.")
+            else:
+                st.info("No chart data available for selected filters.")
+        else:
+            st.warning("No device data found for selected filters.")
+    
+    # ========================================
+    # Transaction Trend Over Time
+    # ========================================
+    with tab4:
+
+        st.subheader("📈 Transaction Trend Over Time")
+
+        # Dropdown filters for trend
+        type_options = ["All"] + sorted(agg_transaction_df["Transaction_type"].dropna().unique())
+        selected_trend_type = st.selectbox("Select Transaction Type", type_options, key="trend_type")
+
+        trend_df = get_transaction_trend(filtered_trans, selected_state, selected_trend_type)
+
+        if not trend_df.empty:
+            fig = px.line(
+                trend_df,
+                x="YearQuarter",
+                y="Transaction_amount",
+                markers=True,
+                title="Transaction Trend",
+                labels={"Transaction_amount": "Amount (₹)", "YearQuarter": "Period"}
+            )
+            fig.update_traces(line_color="orange")
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No data available for selected filters.")
+
+    with tab5:
+        # Raw Data Expanders
+        with st.expander("Show Filtered Transaction Data"):
+            st.dataframe(filtered_trans)
+
+        with st.expander("Show Filtered User Data"):
+            st.dataframe(filtered_user)
+
+        with st.expander("Show Filtered Device Data"):
+            st.dataframe(filtered_device)
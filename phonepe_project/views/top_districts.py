@@ -0,0 +1,18 @@
+'''
+Top Districts view.
+'''
+import streamlit as st
+
+import data
+from analysis import top_kpi_by_location
+
+
+def render(approx_mode):
+    top_district_df = data.load("top_transaction_district")
+
+    st.title("🏙️ Top Districts by Transaction Amount")
+    top_districts = top_kpi_by_location(top_district_df, col="District")
+    if not top_districts.empty:
+        st.bar_chart(top_districts)
+    else:
+        st.info("No data available.")
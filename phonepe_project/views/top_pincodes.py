@@ -0,0 +1,15 @@
+'''
+Top Pincodes view.
+'''
+import streamlit as st
+
+import data
+
+
+def render(approx_mode):
+    st.title("📍 Top Pincodes by Transaction Amount")
+    top_pincodes = data.top_k("top_transaction_pincode", "Pincode", "Transaction_amount")
+    if not top_pincodes.empty:
+        st.bar_chart(top_pincodes)
+    else:
+        st.info("No data available.")
@@ -0,0 +1,21 @@
+'''
+Top Users view: registered users by district and pincode.
+'''
+import streamlit as st
+
+import data
+from analysis import top_kpi_by_location
+
+
+def render(approx_mode):
+    top_user_district_df = data.load("top_user_district")
+    top_user_pincode_df = data.load("top_user_pincode")
+
+    st.title("👥 Top Users Overview")
+    st.subheader("🏙️ By District")
+    top_users_district = top_kpi_by_location(top_user_district_df, col="District", value="RegisteredUsers")
+    st.bar_chart(top_users_district)
+
+    st.subheader("📮 By Pincode")
+    top_users_pincode = top_kpi_by_location(top_user_pincode_df, col="Pincode", value="RegisteredUsers")
+    st.bar_chart(top_users_pincode)
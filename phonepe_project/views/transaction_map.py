@@ -0,0 +1,175 @@
+'''
+Transaction Map view: state-wise choropleth and bubble maps.
+'''
+import streamlit as st
+import plotly.express as px
+import pydeck as pdk
+
+import data
+
+
+# Module level, so they are built once per process instead of on every rerun
+# state names to match GeoJSON
+STATE_NAME_MAP = {
+    'andaman-&-nicobar-islands': 'Andaman and Nicobar Islands',
+    'andhra-pradesh': 'Andhra Pradesh',
+    'arunachal-pradesh': 'Arunachal Pradesh',
+    'assam': 'Assam',
+    'bihar': 'Bihar',
+    'chandigarh': 'Chandigarh',
+    'chhattisgarh': 'Chhattisgarh',
+    'dadra-&-nagar-haveli-&-daman-&-diu': 'Dadra and Nagar Haveli and Daman and Diu',
+    'delhi': 'Delhi',
+    'goa': 'Goa',
+    'gujarat': 'Gujarat',
+    'haryana': 'Haryana',
+    'himachal-pradesh': 'Himachal Pradesh',
+    'jammu-&-kashmir': 'Jammu and Kashmir',
+    'jharkhand': 'Jharkhand',
+    'karnataka': 'Karnataka',
+    'kerala': 'Kerala',
+    'ladakh': 'Ladakh',
+    'madhya-pradesh': 'Madhya Pradesh',
+    'maharashtra': 'Maharashtra',
+    'manipur': 'Manipur',
+    'meghalaya': 'Meghalaya',
+    'mizoram': 'Mizoram',
+    'nagaland': 'Nagaland',
+    'odisha': 'Odisha',
+    'puducherry': 'Puducherry',
+    'punjab': 'Punjab',
+    'rajasthan': 'Rajasthan',
+    'sikkim': 'Sikkim',
+    'tamil-nadu': 'Tamil Nadu',
+    'telangana': 'Telangana',
+    'tripura': 'Tripura',
+    'uttar-pradesh': 'Uttar Pradesh',
+    'uttarakhand': 'Uttarakhand',
+    'west-bengal': 'West Bengal',
+    'lakshadweep': 'Lakshadweep'
+}
+
+# state coords for the bubble map
+STATE_COORDS = {
+    "Andaman and Nicobar Islands": [11.7401, 92.6586],
+    "Andhra Pradesh": [15.9129, 79.7400],
+    "Arunachal Pradesh": [28.2180, 94.7278],
+    "Assam": [26.2006, 92.9376],
+    "Bihar": [25.0961, 85.3131],
+    "Chandigarh": [30.7333, 76.7794],
+    "Chhattisgarh": [21.2787, 81.8661],
+    "Dadra and Nagar Haveli and Daman and Diu": [20.3974, 72.8328],
+    "Delhi": [28.7041, 77.1025],
+    "Goa": [15.2993, 74.1240],
+    "Gujarat": [22.2587, 71.1924],
+    "Haryana": [29.0588, 76.0856],
+    "Himachal Pradesh": [31.1048, 77.1734],
+    "Jammu and Kashmir": [33.7782, 76.5762],
+    "Jharkhand": [23.6102, 85.2799],
+    "Karnataka": [15.3173, 75.7139],
+    "Kerala": [10.8505, 76.2711],
+    "Ladakh": [34.2268, 77.5619],
+    "Madhya Pradesh": [22.9734, 78.6569],
+    "Maharashtra": [19.7515, 75.7139],
+    "Manipur": [24.6637, 93.9063],
+    "Meghalaya": [25.4670, 91.3662],
+    "Mizoram": [23.1645, 92.9376],
+    "Nagaland": [26.1584, 94.5624],
+    "Odisha": [20.9517, 85.0985],
+    "Puducherry": [11.9416, 79.8083],
+    "Punjab": [31.1471, 75.3412],
+    "Rajasthan": [27.0238, 74.2179],
+    "Sikkim": [27.5330, 88.5122],
+    "Tamil Nadu": [11.1271, 78.6569],
+    "Telangana": [18.1124, 79.0193],
+    "Tripura": [23.9408, 91.9882],
+    "Uttar Pradesh": [26.8467, 80.9462],
+    "Uttarakhand": [30.0668, 79.0193],
+    "West Bengal": [22.9868, 87.8550],
+    "Lakshadweep": [10.5667, 72.6417]
+}
+
+
+def render(approx_mode):
+    agg_transaction_df = data.load("agg_transaction")
+
+    st.sidebar.markdown("---")
+    st.sidebar.header("🧭 Map Filters")
+
+    years = ["All"] + sorted(agg_transaction_df["Year"].dropna().unique().tolist())
+    states = ["All"] + sorted(agg_transaction_df["State"].dropna().unique().tolist())
+    quarters = ["All"] + sorted(agg_transaction_df["Quarter"].dropna().unique().tolist())
+
+    selected_year = st.sidebar.selectbox("Select Year", years, key="map_year")
+    selected_state = st.sidebar.selectbox("Select State", states, key="map_state")
+    selected_quarter = st.sidebar.selectbox("Select Quarter", quarters, key="map_quarter")
+
+    # Filter Data
+    filtered_map_df = data.load("agg_transaction", selected_state, selected_year, selected_quarter)
+
+    # Group by state
+    state_summary = filtered_map_df.groupby("State")["Transaction_amount"].sum().reset_index()
+
+    state_summary["State"] = state_summary["State"].map(STATE_NAME_MAP)
+    state_summary.rename(columns={"State": "ST_NM"}, inplace=True)
+
+    # plot - map
+    st.subheader("📍 State-wise Transaction Map (Choropleth View)")
+    fig = px.choropleth(
+        state_summary,
+        geojson="https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson",
+        featureidkey="properties.ST_NM",
+        locations="ST_NM",
+        color="Transaction_amount",
+        color_continuous_scale="YlGnBu",
+        title="🗺️ Transaction Amount by State",
+        height=600
+    )
+    fig.update_geos(fitbounds="locations", visible=False)
+    fig.update_layout(margin={"r": 0, "t": 80, "l": 0, "b": 0})
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Using pydeck
+    # Filter and map data
+    state_df = filtered_map_df.groupby("State")["Transaction_amount"].sum().reset_index()
+    state_df["ST_NM"] = state_df["State"].map(STATE_NAME_MAP)
+    state_df["lat"] = state_df["ST_NM"].map(lambda x: STATE_COORDS.get(x, [None, None])[0])
+    state_df["lon"] = state_df["ST_NM"].map(lambda x: STATE_COORDS.get(x, [None, None])[1])
+    state_df = state_df.dropna(subset=["lat", "lon"])
+
+    # Scale radius
+    max_amount = state_df["Transaction_amount"].max()
+    state_df["radius"] = state_df["Transaction_amount"] / max_amount * 50000  # scaled to avoid huge overlap
+
+    # Add color
+    state_df["color"] = state_df["Transaction_amount"].apply(
+        lambda x: [255, int(255 - (x / max_amount) * 200), 0, 140]
+    )
+    state_df["formatted_amount"] = state_df["Transaction_amount"].apply(lambda x: f"₹{x:,.0f}")
+
+    # pydeck layer
+    layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=state_df,
+        get_position='[lon, lat]',
+        get_radius="radius",
+        get_fill_color="color",
+        pickable=True,
+        auto_highlight=True,
+    )
+
+    # Set view
+    view_state = pdk.ViewState(
+        longitude=78.9629,
+        latitude=22.5937,
+        zoom=4,
+        pitch=0
+    )
+
+    # Render map
+    st.subheader("📍 State-wise Transaction Map (Bubble View)")
+    st.pydeck_chart(pdk.Deck(
+        layers=[layer],
+        initial_view_state=view_state,
+        tooltip={"text": "{ST_NM}\n{formatted_amount}"}
+    ))